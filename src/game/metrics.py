@@ -61,7 +61,7 @@ def _tokenize(text: str) -> List[str]:
     return list(stripped) if stripped else []
 
 
-@dataclass
+@dataclass(slots=True)
 class MindsetRecord:
     round_number: int
     phase: str
@@ -70,7 +70,7 @@ class MindsetRecord:
     suspicion_accuracy: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechRecord:
     round_number: int
     player_id: str
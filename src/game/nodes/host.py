@@ -1,3 +1,4 @@
+import random
 from typing import Dict, Any, cast, TYPE_CHECKING
 
 from ..state import GameState, next_alive_player, generate_phase_id
@@ -83,9 +84,11 @@ def host_stage_switch(state: GameState) -> Dict[str, Any]:
             # All players have spoken, transition to voting
             logger.info("Stage switch detected all speeches complete; starting voting")
             updates = {"game_phase": "voting", "current_votes": {}}
+            # Generate new phase_id for voting; only round and phase are read,
+            # so avoid copying the whole state just to overlay the update.
             updates["phase_id"] = generate_phase_id(
-                state | updates
-            )  # Generate new phase_id for voting
+                {"current_round": state.get("current_round", 1), **updates}
+            )
             return updates
     # No state change needed otherwise, the graph will continue routing.
     return {}
@@ -96,7 +99,12 @@ def host_result(state: GameState, *, metrics: "GameMetrics") -> Dict[str, Any]:
     Calculates the result of a round, eliminates a player, and checks for a winner.
     This node is the aggregation point after voting.
     """
-    eliminated_player = calculate_eliminated_player(state)
+    # Seeded games derive a per-round generator so tie-breaks replay exactly.
+    seed = state.get("host_private_state", {}).get("seed")
+    rng = (
+        random.Random(f"{seed}:{state['current_round']}") if seed is not None else None
+    )
+    eliminated_player = calculate_eliminated_player(state, rng=rng)
 
     logger.info(
         "Host round %d voted out player: %s",
@@ -139,9 +147,9 @@ def _prepare_next_round(state: GameState, eliminated: str | None) -> Dict[str, A
         "current_round": state["current_round"] + 1,
         "current_votes": {},  # Clear votes for the new round
     }
-    updates["phase_id"] = generate_phase_id(
-        state | updates
-    )  # Generate new phase_id for speaking
+    # Generate new phase_id for speaking; updates already carries the new
+    # round and phase, which is all generate_phase_id reads.
+    updates["phase_id"] = generate_phase_id(updates)
     if eliminated:
         updates["eliminated_players"] = [eliminated]
 
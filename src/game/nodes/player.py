@@ -158,7 +158,6 @@ async def player_speech(
         llm_client=llm_client,
         my_word=my_word,
         self_belief=updated_mindset_state.get("self_belief", {}),
-        suspicions=updated_mindset_state.get("suspicions", {}),
         completed_speeches=state["completed_speeches"],
         me=player_id,
         alive=alive_players(state),
@@ -36,23 +36,39 @@ from .state import (
 logger = get_logger(__name__)
 
 
+def _default_mindset() -> PlayerMindset:
+    """Neutral starting mindset; built fresh so players never share dicts."""
+    return {
+        "self_belief": {"role": "civilian", "confidence": 0.5},
+        "suspicions": {},
+    }
+
+
 def assign_roles_and_words(
     players: List[str],
     word_list: List[tuple[str, str]] = None,
     host_private_state: Dict[str, Any] = None,
+    rng: random.Random | None = None,
 ) -> Dict[str, Any]:
     """
     Assigns roles (spy/civilian) and words to players.
     Returns a dict to be merged into the private state.
+
+    Pass a seeded ``rng`` (or a ``seed`` in ``host_private_state``) for a
+    reproducible assignment; a fresh unseeded generator is used otherwise.
     """
     if len(players) < 3:
         raise ValueError("The game requires at least 3 players.")
 
+    seed = host_private_state.get("seed") if host_private_state else None
+    if rng is None:
+        rng = random.Random(seed)
+
     # Calculate spy count based on player count
     spy_count = calculate_spy_count(len(players))
 
-    # Select spies
-    spies = random.sample(players, spy_count)
+    # Select spies (set for O(1) membership checks below)
+    spies_set = set(rng.sample(players, spy_count))
 
     # 1. Check if words are already provided in host_private_state (custom words)
     # If not, select from vocabulary
@@ -69,27 +85,28 @@ def assign_roles_and_words(
             spy_word,
         )
     elif word_list:
-        civilian_word, spy_word = random.choice(word_list)
+        civilian_word, spy_word = rng.choice(word_list)
     else:
         default_vocab = DEFAULT_CONFIG["game"]["vocabulary"]
-        civilian_word, spy_word = random.choice(default_vocab)
+        civilian_word, spy_word = rng.choice(default_vocab)
 
     # 2. Prepare private states
     player_private_states: Dict[str, PlayerPrivateState] = {}
     for p in players:
         player_private_states[p] = {
-            "assigned_word": spy_word if p in spies else civilian_word,
-            "playerMindset": {
-                "self_belief": {"role": "civilian", "confidence": 0.5},
-                "suspicions": {},
-            },
+            "assigned_word": spy_word if p in spies_set else civilian_word,
+            "playerMindset": _default_mindset(),
         }
 
     host_private_state = {
-        "player_roles": {p: ("spy" if p in spies else "civilian") for p in players},
+        "player_roles": {p: ("spy" if p in spies_set else "civilian") for p in players},
         "civilian_word": civilian_word,
         "spy_word": spy_word,
+        "spies_set": frozenset(spies_set),
+        "civilians_set": frozenset(p for p in players if p not in spies_set),
     }
+    if seed is not None:
+        host_private_state["seed"] = seed
 
     return {
         "host_private_state": host_private_state,
@@ -97,47 +114,43 @@ def assign_roles_and_words(
     }
 
 
-def calculate_eliminated_player(state: GameState) -> str | None:
+def calculate_eliminated_player(
+    state: GameState, rng: random.Random | None = None
+) -> str | None:
     """
     Calculates who is eliminated based on the current votes.
-    In case of a tie, randomly select one player to eliminate.
+    In case of a tie, randomly select one player to eliminate using ``rng``
+    (defaults to a fresh unseeded generator).
     """
     votes = state.get("current_votes", {})
     current_phase_id = state.get("phase_id")
 
     valid_votes = get_valid_votes_for_phase(votes, current_phase_id)
 
-    # Extract targets in one line using list comprehension
-    vote_targets = [
-        getattr(vote, "target", None) or vote.get("target")
+    # Tally targets straight into the Counter, resolving each vote's target once
+    vote_counts = Counter(
+        target
         for vote in valid_votes.values()
-        if getattr(vote, "target", None) or vote.get("target")
-    ]
+        if (target := getattr(vote, "target", None) or vote.get("target"))
+    )
 
-    if not vote_targets:
+    if not vote_counts:
         return None
 
-    vote_counts = Counter(vote_targets)
-    most_common = vote_counts.most_common(2)
-
-    # Check for unique maximum
-    if len(most_common) == 1 or most_common[0][1] > most_common[1][1]:
-        return most_common[0][0]
-
-    # Tie case: randomly select one player from the tied players
-    max_votes = most_common[0][1]
+    max_votes = max(vote_counts.values())
     tied_players = [
         player for player, count in vote_counts.items() if count == max_votes
     ]
 
-    if tied_players:
-        eliminated = random.choice(tied_players)
-        logger.info(
-            "Tie detected among %s; randomly eliminated %s", tied_players, eliminated
-        )
-        return eliminated
+    if len(tied_players) == 1:
+        return tied_players[0]
 
-    return None
+    # Tie case: randomly select one player from the tied players
+    eliminated = (rng or random.Random()).choice(tied_players)
+    logger.info(
+        "Tie detected among %s; randomly eliminated %s", tied_players, eliminated
+    )
+    return eliminated
 
 
 def determine_winner(
@@ -147,18 +160,25 @@ def determine_winner(
     Determines if there is a winner based on the current game state.
     Returns 'civilians', 'spies', or None.
     """
-    alive = alive_players(state)
-    roles = host_private_state.get("player_roles", {})
+    alive_set = set(alive_players(state))
+
+    # Role partitions are fixed at setup; derive them only for older host states.
+    spies = host_private_state.get("spies_set")
+    civilians = host_private_state.get("civilians_set")
+    if spies is None or civilians is None:
+        roles = host_private_state.get("player_roles", {})
+        spies = [p for p, role in roles.items() if role == "spy"]
+        civilians = [p for p, role in roles.items() if role == "civilian"]
 
-    alive_spies = [p for p in alive if roles.get(p) == "spy"]
-    alive_civilians = [p for p in alive if roles.get(p) == "civilian"]
+    alive_spies = len(alive_set.intersection(spies))
+    alive_civilians = len(alive_set.intersection(civilians))
 
     # Civilian victory condition: all spies are eliminated
-    if not alive_spies and alive:
+    if not alive_spies and alive_set:
         return "civilians"
 
     # Spy victory condition: number of spies is equal to or greater than civilians
-    if alive and len(alive_spies) >= len(alive_civilians):
+    if alive_set and alive_spies >= alive_civilians:
         return "spies"
 
     return None
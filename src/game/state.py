@@ -19,7 +19,17 @@ Key Concepts:
 import time
 import uuid
 from operator import add
-from typing import List, Literal, TypedDict, Annotated, Optional, Dict, Any
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    NotRequired,
+    Optional,
+    TypedDict,
+)
 
 
 class Speech(TypedDict):
@@ -130,11 +140,18 @@ class HostPrivateState(TypedDict):
         player_roles: Dictionary mapping player_id to role (civilian or spy)
         civilian_word: The word assigned to civilians
         spy_word: The word assigned to spies
+        seed: Optional RNG seed used for reproducible role assignment and
+            tie-breaking
+        spies_set: Player ids assigned the spy role
+        civilians_set: Player ids assigned the civilian role
     """
 
     player_roles: Dict[str, Literal["civilian", "spy"]]
     civilian_word: str
     spy_word: str
+    seed: NotRequired[int]
+    spies_set: NotRequired[FrozenSet[str]]
+    civilians_set: NotRequired[FrozenSet[str]]
 
 
 def merge_votes(
@@ -289,27 +306,19 @@ def next_alive_player(state: GameState) -> str | None:
     Returns:
         Player ID of the next speaker, or None if everyone has spoken this round
     """
-    alive = alive_players(state)
+    current_round = state.get("current_round")
 
-    # Get current round speech records, sorted by seq
-    speeches_this_round = [
-        s
+    # Players who have already spoken this round; speaking order is irrelevant
+    # here, so the round's speeches are neither collected nor sorted.
+    spoken_players = {
+        s["player_id"]
         for s in state.get("completed_speeches", [])
-        if s.get("round") == state.get("current_round")
-    ]
-    speeches_this_round.sort(key=lambda s: s.get("seq", 0))
-
-    # Players who have already spoken
-    spoken_players = {s["player_id"] for s in speeches_this_round}
-
-    # Find all alive players who haven't spoken
-    yet_to_speak = [p for p in alive if p not in spoken_players]
-
-    if not yet_to_speak:
-        return None  # Everyone has spoken this round
+        if s.get("round") == current_round
+    }
 
-    # Return first player who hasn't spoken (maintain initial order)
-    return yet_to_speak[0]
+    # Return first alive player who hasn't spoken (maintain initial order);
+    # None means everyone has spoken this round
+    return next((p for p in alive_players(state) if p not in spoken_players), None)
 
 
 def votes_ready(state: GameState) -> bool:
@@ -6,6 +6,7 @@ This package provides modular components for AI agent decision-making:
 - prompt_builder: Prompt engineering and templates
 - context_builder: Game state to structured context conversion
 - text_utils: Text processing and sanitization
+- response_cache: Optional exact-match LLM response cache
 - strategy_core: Main strategy coordination
 - voting_strategies: Multiple voting strategy tools
 - strategy_selector: LLM-powered strategy selection
@@ -11,14 +11,35 @@ from src.game.state import Speech, PlayerMindset, SelfBelief
 from src.game.strategy.builders.prompt_builder import determine_clarity
 from src.game.strategy.serialization import to_plain_dict
 
+# Reusable %-templates for the per-item tags emitted in tight loops.
+# Roles are Literal["civilian", "spy"] and seq/round values are ints, so neither
+# can contain markup characters; only ids, reasons and speech text get escaped.
+_ALIVE_PLAYER_TMPL = '<player id="%s" status="alive" />'
+_PLAYER_TMPL = '<player id="%s" />'
+_SUSPICION_TMPL = '<suspicion target="%s" role="%s" confidence="%.2f">%s</suspicion>'
+_SPEECH_TMPL = '<speech seq="%s" player="%s">%s</speech>'
+
+# Last untrimmed speech log rendering as (speeches, length, xml). Inference and
+# speech contexts for the same turn share one append-only list, so matching on
+# identity plus length lets the second builder reuse the first rendering.
+_speech_logs_cache: tuple[Sequence[Speech], int, str] | None = None
+
 
 def _as_mapping(value: Any) -> Dict[str, Any]:
     """Convert TypedDict/Pydantic objects into plain dictionaries."""
-    return to_plain_dict(value, lambda: {})
+    if isinstance(value, dict):
+        return value
+    if value is None:
+        return {}
+    return to_plain_dict(value, dict)
 
 
 def _as_float(value: Any, default: float = 0.0) -> float:
     """Best-effort conversion to float with a default fallback."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None:
+        return default
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -35,10 +56,8 @@ def trim_text_for_prompt(text: str, limit: int = 180) -> str:
 
 def format_players_xml(players: Sequence[str], alive: Sequence[str], me: str) -> str:
     """Format player lists as XML."""
-    alive_tags = "".join(
-        f'<player id="{escape(pid)}" status="alive" />' for pid in alive
-    )
-    roster_tags = "".join(f'<player id="{escape(pid)}" />' for pid in players)
+    alive_tags = "".join(_ALIVE_PLAYER_TMPL % escape(pid) for pid in alive)
+    roster_tags = "".join(_PLAYER_TMPL % escape(pid) for pid in players)
     return (
         f'<players me="{escape(me)}">'
         f"<alive>{alive_tags or '<none />'}</alive>"
@@ -51,22 +70,22 @@ def format_mindset_xml(player_mindset: PlayerMindset) -> str:
     """Format player mindset (beliefs and suspicions) as XML."""
     mindset_dict = _as_mapping(player_mindset)
     self_belief = _as_mapping(mindset_dict.get("self_belief"))
-    suspicions = mindset_dict.get("suspicions", {}) or {}
-    suspicions_tags = []
+    suspicions = mindset_dict.get("suspicions") or {}
+
+    suspicions_tags: List[str] = []
+    append = suspicions_tags.append
     for pid, suspicion in suspicions.items():
-        suspicion_dict = _as_mapping(suspicion)
-        trimmed_reason = trim_text_for_prompt(
-            suspicion_dict.get("reason", ""), limit=160
-        )
-        suspicion_role = suspicion_dict.get("role", "civilian")
-        suspicion_conf = _as_float(suspicion_dict.get("confidence", 0.0))
-        suspicions_tags.append(
-            (
-                f'<suspicion target="{escape(pid)}" '
-                f'role="{escape(suspicion_role)}" '
-                f'confidence="{suspicion_conf:.2f}">'
-                f"{escape(trimmed_reason)}"
-                "</suspicion>"
+        suspicion = _as_mapping(suspicion)
+        trimmed_reason = trim_text_for_prompt(suspicion.get("reason", ""), limit=160)
+        suspicion_role = suspicion.get("role", "civilian")
+        suspicion_conf = _as_float(suspicion.get("confidence", 0.0))
+        append(
+            _SUSPICION_TMPL
+            % (
+                escape(pid),
+                suspicion_role,
+                suspicion_conf,
+                escape(trimmed_reason),
             )
         )
 
@@ -74,7 +93,7 @@ def format_mindset_xml(player_mindset: PlayerMindset) -> str:
     self_role = self_belief.get("role", "civilian")
     self_confidence = _as_float(self_belief.get("confidence", 0.0))
     return (
-        f'<mindset self_role="{escape(self_role)}" '
+        f'<mindset self_role="{self_role}" '
         f'self_confidence="{self_confidence:.2f}">'
         f"<suspicions>{suspicions_block}</suspicions>"
         "</mindset>"
@@ -117,11 +136,11 @@ def format_speeches_xml(
             current_round = round_index
 
         segments.append(
-            (
-                f'<speech seq="{speech.get("seq", 0)}" '
-                f'player="{escape(speech.get("player_id", "unknown"))}">'
-                f"{escape(trim_text_for_prompt(speech.get("content", ""), limit=140))}"
-                "</speech>"
+            _SPEECH_TMPL
+            % (
+                speech.get("seq", 0),
+                escape(speech.get("player_id", "unknown")),
+                escape(trim_text_for_prompt(speech.get("content", ""), limit=140)),
             )
         )
 
@@ -132,6 +151,23 @@ def format_speeches_xml(
     return "".join(segments)
 
 
+def _format_speech_logs(completed_speeches: Sequence[Speech]) -> str:
+    """Render the full speech log, reusing the previous rendering when possible."""
+    global _speech_logs_cache
+
+    cached = _speech_logs_cache
+    if (
+        cached is not None
+        and cached[0] is completed_speeches
+        and cached[1] == len(completed_speeches)
+    ):
+        return cached[2]
+
+    speeches_xml = format_speeches_xml(completed_speeches)
+    _speech_logs_cache = (completed_speeches, len(completed_speeches), speeches_xml)
+    return speeches_xml
+
+
 def build_inference_user_context(
     completed_speeches: Sequence[Speech],
     players: List[str],
@@ -142,7 +178,7 @@ def build_inference_user_context(
     """Builds the dynamic context for inference (belief update)."""
     players_xml = format_players_xml(players, alive, me)
     mindset_xml = format_mindset_xml(existing_player_mindset)
-    speeches_xml = format_speeches_xml(completed_speeches)
+    speeches_xml = _format_speech_logs(completed_speeches)
 
     return (
         "<inference_context>"
@@ -172,7 +208,7 @@ def build_speech_user_context(
     alive_tags = "".join(f'<player id="{escape(pid)}" />' for pid in alive)
     alive_block = f"<alive_players>{alive_tags or '<none />'}</alive_players>"
 
-    speech_logs_block = format_speeches_xml(completed_speeches)
+    speech_logs_block = _format_speech_logs(completed_speeches)
 
     if speech_plan:
         plan_goal = _as_mapping(speech_plan.get("goal"))
@@ -208,7 +244,7 @@ def build_speech_user_context(
 
     return (
         "<speech_context>"
-        f'<self role="{escape(self_role)}" confidence="{self_confidence:.2f}" />'
+        f'<self role="{self_role}" confidence="{self_confidence:.2f}" />'
         f'<strategy round="{current_round}" clarity="{clarity_code}">{escape(clarity_desc)}</strategy>'
         f'<speaker id="{escape(me)}" />'
         f'{alive_block}<current_round index="{current_round}" />{plan_section}{speech_logs_block}'
@@ -245,7 +281,7 @@ def build_vote_user_context(
         suspicion_tags.append(
             (
                 f'<suspect id="{escape(pid)}" '
-                f'role="{escape(suspicion_role)}" '
+                f'role="{suspicion_role}" '
                 f'confidence="{suspicion_conf:.2f}">'
                 f"{escape(trimmed_reason)}"
                 "</suspect>"
@@ -272,3 +308,14 @@ def build_vote_user_context(
         f"<guidance>{escape(guidance_text)}</guidance>"
         "</vote_context>"
     )
+
+
+__all__ = [
+    "trim_text_for_prompt",
+    "format_players_xml",
+    "format_mindset_xml",
+    "format_speeches_xml",
+    "build_inference_user_context",
+    "build_speech_user_context",
+    "build_vote_user_context",
+]
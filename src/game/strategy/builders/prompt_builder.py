@@ -4,7 +4,9 @@ Prompt engineering for LLM-powered game strategies.
 Manages all prompt templates and role-specific strategy determination.
 """
 
-from typing import Dict
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Dict
 
 from src.game.state import SelfBelief
 from src.game.strategy.serialization import to_plain_dict
@@ -106,6 +108,56 @@ Do not call both tools. Make your internal choice, invoke the tool, then return
 (Alive players: {alive_count}, current round: {current_round})"""
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a ``str.format`` template into literal/field pairs.
+
+    The returned callable renders the same text as ``template.format(**kw)``
+    for plain ``{name}`` fields without re-parsing the template on each call.
+    """
+    parts: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported template field: {field!r}")
+        parts.append((literal, field))
+
+    def render(**values: object) -> str:
+        chunks: list[str] = []
+        for literal, field in parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(str(values[field]))
+        return "".join(chunks)
+
+    return render
+
+
+_render_inference_prompt = _compile_template(_INFERENCE_PROMPT_PREFIX)
+_render_spy_speech_prompt = _compile_template(_SPY_SPEECH_PROMPT_PREFIX)
+_render_civilian_speech_prompt = _compile_template(_CIVILIAN_SPEECH_PROMPT_PREFIX)
+_render_vote_prompt = _compile_template(_VOTE_PROMPT_PREFIX)
+
+
+# Clarity guidance keyed by (plays_as_spy, round_bucket); see determine_clarity.
+_CLARITY_TABLE: Dict[tuple[bool, int], tuple[str, str]] = {
+    (True, 0): ("low", "LOW clarity — stay broad to blend with civilians"),
+    (True, 1): (
+        "medium",
+        "MEDIUM clarity — add safe overlaps without exposing differences",
+    ),
+    (True, 2): (
+        "medium",
+        "MEDIUM clarity — stay measured while matching the group's detail level",
+    ),
+    (False, 0): ("low", "LOW clarity — broad and neutral foundation"),
+    (False, 1): (
+        "medium",
+        "MEDIUM clarity — start introducing gentle differentiators",
+    ),
+    (False, 2): ("high", "HIGH clarity — press with confident, specific traits"),
+}
+
+
 def determine_clarity(
     role: str, self_confidence: float, current_round: int
 ) -> tuple[str, str]:
@@ -113,27 +165,13 @@ def determine_clarity(
     # TODO: When plan_speech fully controls clarity selection, collapse this helper
     # into the planning workflow to avoid maintaining duplicate heuristics.
     if role == "spy" and self_confidence > 0.5:
-        if current_round <= 2:
-            return (
-                "low",
-                "LOW clarity — stay broad to blend with civilians",
-            )
-        if current_round <= 4:
-            return (
-                "medium",
-                "MEDIUM clarity — add safe overlaps without exposing differences",
-            )
-        return (
-            "medium",
-            "MEDIUM clarity — stay measured while matching the group's detail level",
-        )
-
-    # Civilian defaults
-    if current_round <= 1:
-        return "low", "LOW clarity — broad and neutral foundation"
-    if current_round == 2:
-        return "medium", "MEDIUM clarity — start introducing gentle differentiators"
-    return "high", "HIGH clarity — press with confident, specific traits"
+        # Spies ramp up slowly: rounds 1-2, 3-4, then 5+.
+        round_bucket = 0 if current_round <= 2 else 1 if current_round <= 4 else 2
+        return _CLARITY_TABLE[(True, round_bucket)]
+
+    # Civilian defaults: round 1, round 2, then 3+.
+    round_bucket = 0 if current_round <= 1 else 1 if current_round == 2 else 2
+    return _CLARITY_TABLE[(False, round_bucket)]
 
 
 def format_speech_system_prompt(my_word: str, self_belief: SelfBelief) -> str:
@@ -147,26 +185,33 @@ def format_speech_system_prompt(my_word: str, self_belief: SelfBelief) -> str:
         belief_dict.get("role") == "spy"
         and float(belief_dict.get("confidence", 0.0)) >= 0.7
     )
+    return _speech_system_prompt(my_word, is_confident_spy)
+
+
+# System prompts depend only on a few small, hashable inputs that repeat across
+# turns (word, counts, round, role template), so each one is formatted once.
+@lru_cache(maxsize=64)
+def _speech_system_prompt(my_word: str, is_confident_spy: bool) -> str:
     if is_confident_spy:
-        template = _SPY_SPEECH_PROMPT_PREFIX
-    else:
-        template = _CIVILIAN_SPEECH_PROMPT_PREFIX
-    return template.format(my_word=my_word)
+        return _render_spy_speech_prompt(my_word=my_word)
+    return _render_civilian_speech_prompt(my_word=my_word)
 
 
+@lru_cache(maxsize=64)
 def format_inference_system_prompt(
     my_word: str, player_count: int, spy_count: int
 ) -> str:
     """Format the inference system prompt with game parameters."""
-    return _INFERENCE_PROMPT_PREFIX.format(
+    return _render_inference_prompt(
         my_word=my_word, player_count=player_count, spy_count=spy_count
     )
 
 
+@lru_cache(maxsize=64)
 def format_vote_system_prompt(
     my_word: str, alive_count: int, current_round: int
 ) -> str:
     """Format system prompt for voting decisions."""
-    return _VOTE_PROMPT_PREFIX.format(
+    return _render_vote_prompt(
         my_word=my_word, alive_count=alive_count, current_round=current_round
     )
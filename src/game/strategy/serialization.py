@@ -21,8 +21,13 @@ def to_plain_dict(value: Any, default_factory: Callable[[], T]) -> T:
     if value is None:
         return default_factory()
 
-    if hasattr(value, "model_dump"):
-        return cast(T, value.model_dump())
+    # Plain dicts are by far the most common input; skip attribute probing.
+    if type(value) is dict:
+        return value
+
+    model_dump = getattr(value, "model_dump", None)
+    if model_dump is not None:
+        return cast(T, model_dump())
 
     if isinstance(value, dict):
         return cast(T, value)
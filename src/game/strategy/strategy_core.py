@@ -7,12 +7,12 @@ for player mindset updates and speech generation.
 
 import asyncio
 import inspect
+import warnings
+from functools import lru_cache
 from typing import Any, List, Dict, Sequence, cast
 from venv import logger
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain.agents import create_agent
-from langchain.agents.structured_output import ToolStrategy
 
 from src.game.agent_tools.vote_tools import vote_tools
 from src.game.agent_tools.speech_tools import speech_planning_tools
@@ -29,9 +29,14 @@ from src.game.strategy.builders.context_builder import (
     build_vote_user_context,
 )
 from src.game.strategy.utils.logging_utils import log_self_belief_update
+from src.game.strategy.utils.response_cache import (
+    get_cached_response,
+    response_cache_enabled,
+    response_cache_key,
+    store_response,
+)
 from src.game.strategy.llm_schemas import (
     PlayerMindsetModel,
-    SelfBeliefModel,
     VoteDecisionModel,
 )
 from src.game.strategy.builders.prompt_builder import (
@@ -39,9 +44,31 @@ from src.game.strategy.builders.prompt_builder import (
     format_speech_system_prompt,
     format_vote_system_prompt,
 )
+from src.game.strategy.serialization import normalize_mindset
 from src.game.strategy.utils.text_utils import sanitize_speech_output
 
 
+def create_agent(*args: Any, **kwargs: Any) -> Any:
+    """Build a LangChain agent, importing ``langchain.agents`` on first use."""
+    from langchain.agents import create_agent as _create_agent
+
+    return _create_agent(*args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _tool_strategy(schema: type, tool_message_content: str) -> Any:
+    """
+    Return the ToolStrategy response format for ``schema``, built once.
+
+    ToolStrategy derives the tool spec from ``schema.model_json_schema()`` on
+    construction, so sharing one instance per schema avoids regenerating the
+    JSON schema every time an agent is created.
+    """
+    from langchain.agents.structured_output import ToolStrategy
+
+    return ToolStrategy(schema=schema, tool_message_content=tool_message_content)
+
+
 async def _invoke_async(target: Any, *args: Any, **kwargs: Any) -> Any:
     """Awaitably invoke LangChain runnables, falling back to sync methods."""
     ainvoke = getattr(target, "ainvoke", None)
@@ -56,23 +83,59 @@ async def _invoke_async(target: Any, *args: Any, **kwargs: Any) -> Any:
     raise AttributeError(f"Object {target!r} has neither ainvoke nor invoke.")
 
 
-def _to_mindset_model(
-    mindset: PlayerMindset | PlayerMindsetModel | None,
-) -> PlayerMindsetModel:
-    """Convert shared-state mindset data into a Pydantic model."""
-    if isinstance(mindset, PlayerMindsetModel):
-        return mindset
+def _system_message(llm_client: Any, system_prompt: str) -> SystemMessage:
+    """
+    Build the static system message, marking it cacheable where supported.
 
-    if mindset is None:
-        return PlayerMindsetModel(
-            self_belief=SelfBeliefModel(role="civilian", confidence=0.5),
-            suspicions={},
+    Anthropic models (e.g. via OpenRouter) only reuse a prompt prefix when the
+    block carries an explicit ``cache_control`` marker; OpenAI and DeepSeek
+    cache repeated prefixes automatically and reject unknown block fields, so
+    they keep the plain string form. Either way the static prompt stays first.
+    """
+    model_name = getattr(llm_client, "model_name", None)
+    if isinstance(model_name, str) and (
+        model_name.startswith("anthropic/") or "claude" in model_name
+    ):
+        return SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
         )
+    return SystemMessage(content=system_prompt)
+
+
+# Mindset agents keyed by id(llm_client). Entries keep the client alive so a
+# recycled id can never match, and the identity check guards against reuse.
+_MINDSET_AGENT_CACHE_SIZE = 16
+_mindset_agents: Dict[int, tuple[Any, Any]] = {}
+
+
+def _get_mindset_agent(llm_client: Any) -> Any:
+    """Return the mindset agent for ``llm_client``, building it on first use."""
+    cached = _mindset_agents.get(id(llm_client))
+    if cached is not None and cached[0] is llm_client:
+        return cached[1]
 
-    if hasattr(mindset, "model_dump"):
-        return PlayerMindsetModel(**mindset.model_dump())
+    # Create agent with ToolStrategy for structured output so models without
+    # native structured output will fall back to tool calling automatically.
+    response_format = _tool_strategy(
+        schema=PlayerMindsetModel,
+        tool_message_content="Player mindset captured.",
+    )
+    agent = create_agent(
+        model=llm_client,
+        tools=[],
+        response_format=response_format,
+    )
 
-    return PlayerMindsetModel(**cast(Dict[str, Any], mindset))
+    if len(_mindset_agents) >= _MINDSET_AGENT_CACHE_SIZE:
+        _mindset_agents.pop(next(iter(_mindset_agents)))
+    _mindset_agents[id(llm_client)] = (llm_client, agent)
+    return agent
 
 
 def _mindset_model_to_state(model: PlayerMindsetModel) -> PlayerMindset:
@@ -106,8 +169,8 @@ async def llm_update_player_mindset(
     Returns:
         Updated PlayerMindset with new beliefs
     """
-    existing_model = _to_mindset_model(existing_player_mindset)
-    existing_state = _mindset_model_to_state(existing_model)
+    # Shared state already carries plain dicts; only models need dumping.
+    existing_state = normalize_mindset(existing_player_mindset)
     existing_self_belief = existing_state.get(
         "self_belief", {"role": "civilian", "confidence": 0.5}
     )
@@ -124,23 +187,22 @@ async def llm_update_player_mindset(
         completed_speeches, players, alive, me, existing_state
     )
 
-    # Create agent with ToolStrategy for structured output so models without
-    # native structured output will fall back to tool calling automatically.
-    response_format = ToolStrategy(
-        schema=PlayerMindsetModel,
-        tool_message_content="Player mindset captured.",
-    )
+    cache_key = None
+    if response_cache_enabled():
+        cache_key = response_cache_key(
+            "mindset", llm_client, system_prompt, user_context
+        )
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            log_self_belief_update(me, existing_self_belief, cached["self_belief"])
+            return cached
 
-    agent = create_agent(
-        model=llm_client,
-        tools=[],
-        response_format=response_format,
-    )
+    agent = _get_mindset_agent(llm_client)
 
     try:
         # Include system prompt in the messages
         messages = [
-            SystemMessage(content=system_prompt),
+            _system_message(llm_client, system_prompt),
             HumanMessage(content=user_context),
         ]
         result = await _invoke_async(agent, {"messages": messages})
@@ -157,6 +219,8 @@ async def llm_update_player_mindset(
                 existing_self_belief,
                 new_state.get("self_belief", {"role": "civilian", "confidence": 0.5}),
             )
+            if cache_key is not None:
+                store_response(cache_key, new_state)
             return new_state
     except Exception as exc:
         logger.exception("Structured mindset failed: %s", exc)
@@ -174,12 +238,12 @@ async def llm_generate_speech(
     llm_client: Any,
     my_word: str,
     self_belief: SelfBelief,
-    suspicions: Dict[str, Any],
     completed_speeches: Sequence[Speech],
     me: str,
     alive: List[str],
     current_round: int,
     speech_plan: Dict[str, Any] | None = None,
+    **legacy_kwargs: Any,
 ) -> str:
     """
     Use LLM to generate a strategic speech based on current beliefs.
@@ -188,16 +252,30 @@ async def llm_generate_speech(
         llm_client: Language model client
         my_word: Player's assigned word
         self_belief: Current belief about own role
-        suspicions: Suspicions about other players (unused but kept for API compatibility)
         completed_speeches: History of all speeches
         me: Current player's ID
         alive: Currently alive player IDs
         current_round: Current game round number
         speech_plan: Optional structured plan produced by plan_speech tool
+        **legacy_kwargs: Accepts the removed ``suspicions`` argument with a
+            DeprecationWarning
 
     Returns:
         Generated speech as a single-line string
     """
+    if "suspicions" in legacy_kwargs:
+        legacy_kwargs.pop("suspicions")
+        warnings.warn(
+            "llm_generate_speech() no longer uses 'suspicions'; stop passing it.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    if legacy_kwargs:
+        raise TypeError(
+            "llm_generate_speech() got unexpected keyword arguments: "
+            + ", ".join(sorted(legacy_kwargs))
+        )
+
     system_prompt = format_speech_system_prompt(my_word, self_belief)
     user_context = build_speech_user_context(
         self_belief,
@@ -208,15 +286,27 @@ async def llm_generate_speech(
         speech_plan=speech_plan,
     )
 
+    cache_key = None
+    if response_cache_enabled():
+        cache_key = response_cache_key(
+            "speech", llm_client, system_prompt, user_context
+        )
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
     messages = [
-        SystemMessage(content=system_prompt),
+        _system_message(llm_client, system_prompt),
         HumanMessage(content=user_context),
     ]
 
     response = await _invoke_async(llm_client, messages)
 
     raw_text = response.content if hasattr(response, "content") else response
-    return sanitize_speech_output(raw_text)
+    speech = sanitize_speech_output(raw_text)
+    if cache_key is not None and speech:
+        store_response(cache_key, speech)
+    return speech
 
 
 def plan_player_speech(
@@ -265,7 +355,7 @@ async def llm_decide_vote(
         me,
         mindset_overrides={me: current_mindset},
     )
-    response_format = ToolStrategy(
+    response_format = _tool_strategy(
         schema=VoteDecisionModel,
         tool_message_content="Vote decision captured.",
     )
@@ -294,7 +384,7 @@ async def llm_decide_vote(
             agent,
             {
                 "messages": [
-                    SystemMessage(content=system_prompt),
+                    _system_message(llm_client, system_prompt),
                     HumanMessage(content=vote_context),
                 ]
             },
@@ -4,14 +4,66 @@ Logging utilities for tracking game state changes.
 Provides structured logging for debugging AI agent belief evolution.
 """
 
+import atexit
 import json
 import os
+import queue
+import random
+import threading
+import time
 from datetime import datetime
 from typing import Any, Dict
 
+from src.game.logger import get_logger
 from src.game.state import SelfBelief
 from src.game.strategy.serialization import to_plain_dict
 
+try:  # Optional fast encoder; the stdlib json module is used when absent.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment.
+    orjson = None
+
+# Belief updates are appended by a background writer: callers only enqueue
+# encoded lines, and the writer flushes once 64KB are buffered or 100ms after
+# the first pending line, whichever comes first.
+_LOG_DIR = "logs"
+_LOG_PATH = os.path.join(_LOG_DIR, "self_belief_updates.log")
+_FLUSH_BYTES = 64 * 1024
+_FLUSH_INTERVAL = 0.1
+
+# Fraction of belief changes to drop at random (0 keeps every change).
+_RATE_LIMIT_ENV = "LIEGRAPH_BELIEF_LOG_RATE_LIMIT"
+
+
+def _read_rate_limit() -> float:
+    try:
+        return min(max(float(os.getenv(_RATE_LIMIT_ENV, "0")), 0.0), 1.0)
+    except ValueError:
+        return 0.0
+
+
+# Resolved on first use rather than at import, so a .env file loaded after
+# this module (src.tools.llm runs load_dotenv) still takes effect.
+_rate_limit: float | None = None
+
+
+def _get_rate_limit() -> float:
+    global _rate_limit
+
+    if _rate_limit is None:
+        _rate_limit = _read_rate_limit()
+    return _rate_limit
+
+
+_pending: "queue.SimpleQueue[bytes | None]" = queue.SimpleQueue()
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+# Set once the log file cannot be opened or written; later updates are dropped
+# instead of queueing forever behind a dead writer.
+_log_disabled = False
+
+logger = get_logger(__name__)
+
 
 def _belief_to_dict(belief: SelfBelief) -> Dict[str, Any]:
     """Convert belief data into a plain dictionary."""
@@ -21,6 +73,99 @@ def _belief_to_dict(belief: SelfBelief) -> Dict[str, Any]:
     )
 
 
+def _encode_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry as one UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# Local-time "YYYY-MM-DDTHH:MM:SS" prefix for the most recent whole second.
+_cached_second = -1
+_cached_prefix = ""
+
+
+def _now_isoformat() -> str:
+    """Current local time in isoformat, re-running strftime once per second."""
+    global _cached_second, _cached_prefix
+
+    now_ns = time.time_ns()
+    second, fraction_ns = divmod(now_ns, 1_000_000_000)
+    if second != _cached_second:
+        _cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _cached_second = second
+    return f"{_cached_prefix}.{fraction_ns // 1000:06d}"
+
+
+def _drain_log_queue() -> None:
+    """Write queued log lines in batches until the shutdown sentinel arrives."""
+    try:
+        os.makedirs(_LOG_DIR, exist_ok=True)
+        with open(_LOG_PATH, "ab", buffering=_FLUSH_BYTES) as fp:
+            while True:
+                line = _pending.get()
+                if line is None:
+                    return
+                fp.write(line)
+
+                deadline = time.monotonic() + _FLUSH_INTERVAL
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        line = _pending.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if line is None:
+                        return
+                    fp.write(line)
+                fp.flush()
+    except OSError as exc:
+        _disable_log(exc)
+
+
+def _disable_log(exc: OSError) -> None:
+    """Stop belief logging after an I/O failure and discard queued lines."""
+    global _log_disabled, _writer
+
+    _log_disabled = True
+    with _writer_lock:
+        _writer = None
+    logger.warning("Self-belief logging disabled; cannot write %s: %s", _LOG_PATH, exc)
+    while True:
+        try:
+            _pending.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _ensure_writer() -> None:
+    """Start the background log writer on first use."""
+    global _writer
+
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(
+                target=_drain_log_queue, name="self-belief-log", daemon=True
+            )
+            _writer.start()
+
+
+def flush_self_belief_log() -> None:
+    """Stop the background writer after it has written every queued line."""
+    global _writer
+
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is None:
+        return
+    _pending.put(None)
+    writer.join(timeout=5)
+
+
+atexit.register(flush_self_belief_log)
+
+
 def log_self_belief_update(
     player_id: str,
     old_belief: SelfBelief,
@@ -30,18 +175,17 @@ def log_self_belief_update(
     """
     Log self_belief updates to a file for debugging.
 
+    Updates that leave the belief unchanged are skipped, and changes can be
+    sampled down via the LIEGRAPH_BELIEF_LOG_RATE_LIMIT environment variable.
+
     Args:
         player_id: ID of the player
         old_belief: Previous self_belief state
         new_belief: Updated self_belief state
         timestamp: Optional timestamp for the update
     """
-    if timestamp is None:
-        timestamp = datetime.now()
-
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, f"self_belief_updates.log")
+    if _log_disabled:
+        return
 
     old_data = _belief_to_dict(old_belief)
     new_data = _belief_to_dict(new_belief)
@@ -51,8 +195,14 @@ def log_self_belief_update(
     old_conf = float(old_data.get("confidence", 0.0))
     new_conf = float(new_data.get("confidence", 0.0))
 
+    if old_role == new_role and abs(new_conf - old_conf) < 1e-9:
+        return
+    rate_limit = _get_rate_limit()
+    if rate_limit and random.random() < rate_limit:
+        return
+
     log_entry = {
-        "timestamp": timestamp.isoformat(),
+        "timestamp": _now_isoformat() if timestamp is None else timestamp.isoformat(),
         "player_id": player_id,
         "old_belief": {"role": old_role, "confidence": old_conf},
         "new_belief": {"role": new_role, "confidence": new_conf},
@@ -62,5 +212,5 @@ def log_self_belief_update(
         },
     }
 
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    _ensure_writer()
+    _pending.put(_encode_line(log_entry))
@@ -0,0 +1,84 @@
+"""
+In-process cache for LLM responses keyed by the exact prompt sent.
+
+Self-play and benchmark sweeps (especially seeded ones) replay identical
+contexts; caching lets those repeats skip the LLM round-trip. The cache is
+disabled unless LIEGRAPH_RESPONSE_CACHE_SIZE is set to a positive entry count,
+so live games keep sampling fresh responses.
+"""
+
+import os
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import blake2b
+from typing import Any
+
+_SIZE_ENV = "LIEGRAPH_RESPONSE_CACHE_SIZE"
+
+
+def _read_cache_size() -> int:
+    try:
+        return max(int(os.getenv(_SIZE_ENV, "0")), 0)
+    except ValueError:
+        return 0
+
+
+# Read on first use rather than at import, so values from a .env file loaded
+# after this module (src.tools.llm runs load_dotenv) still take effect.
+_max_entries: int | None = None
+_responses: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def _cache_size() -> int:
+    global _max_entries
+
+    if _max_entries is None:
+        _max_entries = _read_cache_size()
+    return _max_entries
+
+
+def response_cache_enabled() -> bool:
+    """Return True when responses should be looked up and stored."""
+    return _cache_size() > 0
+
+
+def response_cache_key(
+    kind: str, llm_client: Any, system_prompt: str, user_context: str
+) -> str:
+    """Hash the call kind, model name and both prompts into a cache key."""
+    model_name = getattr(llm_client, "model_name", None)
+    digest = blake2b(digest_size=16)
+    for part in (kind, model_name if isinstance(model_name, str) else ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(system_prompt.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(user_context.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_cached_response(key: str) -> Any | None:
+    """Return a copy of the cached response for ``key``, or None on a miss."""
+    if key not in _responses:
+        return None
+    _responses.move_to_end(key)
+    return deepcopy(_responses[key])
+
+
+def store_response(key: str, value: Any) -> None:
+    """Remember ``value`` for ``key``, evicting the least recently used entry."""
+    if not response_cache_enabled():
+        return
+    _responses[key] = deepcopy(value)
+    _responses.move_to_end(key)
+    while len(_responses) > _cache_size():
+        _responses.popitem(last=False)
+
+
+def configure_response_cache(max_entries: int) -> None:
+    """Resize the cache at runtime; ``0`` disables it and drops all entries."""
+    global _max_entries
+
+    _max_entries = max(max_entries, 0)
+    while len(_responses) > _max_entries:
+        _responses.popitem(last=False)
@@ -16,12 +16,9 @@ def sanitize_speech_output(text: Any) -> str:
     if text is None:
         return ""
 
-    raw = str(text)
-    lines = [
-        line.strip() for line in raw.replace("\r", "").splitlines() if line.strip()
-    ]
-    candidate = lines[-1] if lines else raw.strip()
-    candidate = candidate.replace("\n", " ")
-    candidate = _EMOJI_REGEX.sub("", candidate)
-    candidate = " ".join(candidate.split())
-    return candidate
+    # Keep only the last non-blank line; walking backwards avoids stripping
+    # and filtering every line of a long multi-line completion.
+    for line in reversed(str(text).replace("\r", "").splitlines()):
+        if line and not line.isspace():
+            return " ".join(_EMOJI_REGEX.sub("", line).split())
+    return ""
@@ -1,18 +1,12 @@
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 from typing import Protocol
 
 from src.game.logger import get_logger
 
-try:  # Imported lazily so pure-Python usage works without IPython.
-    from IPython import get_ipython
-    from IPython.display import Image, display
-except ImportError:  # pragma: no cover - notebooks only.
-    get_ipython = None
-    Image = None
-    display = None
-
 
 class _GraphLike(Protocol):
     def draw_mermaid_png(self) -> bytes: ...
@@ -26,15 +20,42 @@ def save_png(png_bytes: bytes, filename: str | Path = "graph.png") -> Path:
     """Persist raw PNG bytes and preplayer_context in IPython when available."""
     output_path = Path(filename)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(png_bytes)
+    _write_unbuffered(output_path, png_bytes)
     logger.info("Graph saved to %s", output_path)
 
-    if get_ipython and Image and display and get_ipython():
-        display(Image(png_bytes))
-
+    _display_in_notebook(png_bytes)
     return output_path
 
 
+def _write_unbuffered(path: Path, data: bytes) -> None:
+    """Write ``data`` straight to ``path`` without Python-level buffering."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        # Graph images are written once and rarely re-read; keep them out of
+        # the page cache during batch runs.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _display_in_notebook(png_bytes: bytes) -> None:
+    """Show the image inline when running under an IPython kernel."""
+    # A live IPython session has already imported IPython; scripts skip the import.
+    if "IPython" not in sys.modules:
+        return
+    try:
+        from IPython import get_ipython
+        from IPython.display import Image, display
+    except ImportError:  # pragma: no cover - notebooks only.
+        return
+    if get_ipython():
+        display(Image(png_bytes))
+
+
 def save_graph_image(
     app: _AppLike, filename: str | Path = "graph.png", *, xray: bool = False
 ) -> Path | None:
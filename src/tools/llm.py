@@ -10,12 +10,19 @@ from __future__ import annotations
 
 import os
 from collections.abc import Mapping
-from typing import Any, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 from langchain_core.runnables import RunnableConfig
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# Loaded at import so .env values are in os.environ before the first provider
+# lookup; _from_env memoizes whatever it reads. Settings read elsewhere (log
+# level, belief-log sampling, response cache) are resolved lazily on first use.
 load_dotenv()
 
 _PROVIDER_SETTINGS: dict[str, dict[str, Any]] = {
@@ -62,6 +69,43 @@ _PROVIDER_SETTINGS: dict[str, dict[str, Any]] = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class _ProviderResolver:
+    """Flattened ``(env_var, default)`` pairs for one provider's settings."""
+
+    name: str
+    model: tuple[str | None, Any]
+    temperature: tuple[str | None, Any]
+    api_key: tuple[str | None, Any]
+    base_url: tuple[str | None, Any]
+
+
+def _build_resolver(name: str, settings: dict[str, Any]) -> _ProviderResolver:
+    env_names = settings["env"]
+    defaults = settings["defaults"]
+    return _ProviderResolver(
+        name=name,
+        model=(env_names.get("model"), defaults.get("model")),
+        temperature=(env_names.get("temperature"), defaults.get("temperature", 0.7)),
+        api_key=(env_names.get("api_key"), defaults.get("api_key")),
+        base_url=(env_names.get("base_url"), defaults.get("base_url")),
+    )
+
+
+# Built once so client construction never re-walks the nested settings dicts.
+_PROVIDER_RESOLVERS: dict[str, _ProviderResolver] = {
+    name: _build_resolver(name, settings)
+    for name, settings in _PROVIDER_SETTINGS.items()
+}
+
+
+# Environment lookups are memoized; call reset_env_cache() after changing
+# os.environ (e.g. in tests) so the new values are picked up.
+_ENV_CACHE: dict[str, str | None] = {}
+# Providers whose credentials require_llm_provider_api_key has already confirmed.
+_VALIDATED_PROVIDERS: set[str] = set()
+
+
 def _from_env(var_name: str | None) -> str | None:
     """Get environment variable value if variable name is provided.
 
@@ -71,7 +115,18 @@ def _from_env(var_name: str | None) -> str | None:
     Returns:
         Environment variable value or None if not set or var_name is None
     """
-    return os.getenv(var_name) if var_name else None
+    if not var_name:
+        return None
+    try:
+        return _ENV_CACHE[var_name]
+    except KeyError:
+        return _ENV_CACHE.setdefault(var_name, os.environ.get(var_name))
+
+
+def reset_env_cache() -> None:
+    """Forget memoized environment lookups and validated providers."""
+    _ENV_CACHE.clear()
+    _VALIDATED_PROVIDERS.clear()
 
 
 def _coerce_float(value: str | None) -> float | None:
@@ -128,6 +183,14 @@ def _resolve_value(
     return default
 
 
+def _chat_openai_class() -> type[ChatOpenAI]:
+    """Import ChatOpenAI on first use; langchain_openai pulls in the OpenAI SDK."""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI
+
+
+@lru_cache(maxsize=1)
 def _default_provider() -> str:
     """Determine the default LLM provider from configuration.
 
@@ -167,52 +230,31 @@ def create_llm(
         **overrides: Additional parameters to pass to ChatOpenAI
 
     Returns:
-        Configured ChatOpenAI instance
+        Configured ChatOpenAI instance, shared by calls that resolve to the
+        same configuration (``create_llm.cache_clear()`` drops cached clients)
 
     Raises:
         ValueError: If the specified provider is not supported or no default
             model is configured for the selected provider.
     """
-    provider_name, settings = _resolve_provider_settings(provider)
+    resolver = _resolve_provider(provider)
 
     # All supported providers expose an OpenAI-compatible chat completions API, so
     # ChatOpenAI remains a viable wrapper as long as we supply their base URL and API key.
     # Introducing providers with non-OpenAI protocols will require branching here.
-    env_names = settings["env"]
-    defaults = settings["defaults"]
-
-    # Resolve configuration values
-    resolved_model = _resolve_value(
-        model,
-        env_names.get("model"),
-        defaults.get("model"),
-    )
+    resolved_model = _resolve_value(model, *resolver.model)
     if resolved_model is None:
         raise ValueError(
-            f"No default model configured for provider '{provider_name}'. "
+            f"No default model configured for provider '{resolver.name}'. "
             "Specify a model explicitly when calling create_llm."
         )
 
     resolved_temperature = (
-        _resolve_value(
-            temperature,
-            env_names.get("temperature"),
-            defaults.get("temperature", 0.7),
-            transform=_coerce_float,
-        )
+        _resolve_value(temperature, *resolver.temperature, transform=_coerce_float)
         or 0.0
     )
-
-    resolved_api_key = _resolve_value(
-        api_key,
-        env_names.get("api_key"),
-        defaults.get("api_key"),
-    )
-    resolved_base_url = _resolve_value(
-        base_url,
-        env_names.get("base_url"),
-        defaults.get("base_url"),
-    )
+    resolved_api_key = _resolve_value(api_key, *resolver.api_key)
+    resolved_base_url = _resolve_value(base_url, *resolver.base_url)
 
     # Build configuration dictionary
     config: dict[str, Any] = {
@@ -226,37 +268,50 @@ def create_llm(
         config["base_url"] = resolved_base_url
 
     config.update(overrides)
-    return ChatOpenAI(**config)
 
+    # Identical configurations share one client; unhashable overrides
+    # (e.g. nested dicts) fall back to building a fresh instance.
+    config_items = tuple(sorted(config.items()))
+    try:
+        hash(config_items)
+    except TypeError:
+        return _chat_openai_class()(**config)
+    return _build_llm(config_items)
 
-def _is_api_key_configured(settings: dict[str, Any]) -> bool:
-    env_names = settings["env"]
-    defaults = settings["defaults"]
 
-    api_key_env = env_names.get("api_key")
-    default_api_key = defaults.get("api_key")
+@lru_cache(maxsize=32)
+def _build_llm(config_items: tuple[tuple[str, Any], ...]) -> ChatOpenAI:
+    """Construct (once per distinct configuration) a ChatOpenAI client."""
+    return _chat_openai_class()(**dict(config_items))
+
+
+create_llm.cache_clear = _build_llm.cache_clear
+
+
+def _is_api_key_configured(resolver: _ProviderResolver) -> bool:
+    api_key_env, default_api_key = resolver.api_key
 
     # Check if API key is available through defaults
     if default_api_key:
         return True
 
     # Check if API key is available through environment variable
-    if api_key_env and os.getenv(api_key_env):
+    if _from_env(api_key_env):
         return True
     return False
 
 
-def _resolve_provider_settings(provider: str | None) -> tuple[str, dict[str, Any]]:
+def _resolve_provider(provider: str | None) -> _ProviderResolver:
     provider_name = (
-        provider or os.getenv("LLM_PROVIDER") or _default_provider()
+        provider or _from_env("LLM_PROVIDER") or _default_provider()
     ).lower()
-    settings = _PROVIDER_SETTINGS.get(provider_name)
-    if settings is None:
+    resolver = _PROVIDER_RESOLVERS.get(provider_name)
+    if resolver is None:
         raise ValueError(
             f"Unsupported LLM provider '{provider_name}'. "
             f"Configure LLM_PROVIDER to one of: {', '.join(sorted(_PROVIDER_SETTINGS))}."
         )
-    return provider_name, settings
+    return resolver
 
 
 def require_llm_provider_api_key(provider: str | None = None) -> None:
@@ -272,28 +327,25 @@ def require_llm_provider_api_key(provider: str | None = None) -> None:
         ValueError: If provider is unsupported
         RuntimeError: If no API key is configured for the provider
     """
-    provider_name = (
-        provider or os.getenv("LLM_PROVIDER") or _default_provider()
-    ).lower()
-    settings = _PROVIDER_SETTINGS.get(provider_name)
-    if settings is None:
-        raise ValueError(
-            f"Unsupported LLM provider '{provider_name}'. "
-            f"Configure LLM_PROVIDER to one of: {', '.join(sorted(_PROVIDER_SETTINGS))}."
-        )
-
-    if _is_api_key_configured(settings):
+    resolver = _resolve_provider(provider)
+    if resolver.name in _VALIDATED_PROVIDERS:
+        return
+    if _is_api_key_configured(resolver):
+        _VALIDATED_PROVIDERS.add(resolver.name)
         return
 
-    api_key_env = settings.get("env", {}).get("api_key")
+    api_key_env = resolver.api_key[0]
     raise RuntimeError(
-        f"{api_key_env or 'API key'} must be set for provider '{provider_name}'. "
+        f"{api_key_env or 'API key'} must be set for provider '{resolver.name}'. "
         "Set the environment variable or pass `api_key` to `create_llm`."
     )
 
 
 def overrides_from_config(config: RunnableConfig | None) -> dict[str, Any]:
-    """Return the `configurable` overrides mapping from a RunnableConfig."""
+    """Return the `configurable` overrides mapping from a RunnableConfig.
+
+    A plain dict is returned as-is rather than copied; treat it as read-only.
+    """
 
     if not config:
         return {}
@@ -305,8 +357,8 @@ def overrides_from_config(config: RunnableConfig | None) -> dict[str, Any]:
             "configurable", {}
         )
 
-    if isinstance(configurable, Mapping):
-        return dict(configurable)
+    if type(configurable) is dict:
+        return configurable
     return dict(configurable or {})
 
 
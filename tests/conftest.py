@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+from src.game.config import load_config
+from src.game.metrics import GameMetrics
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Run coroutines on one event loop shared by the whole test session."""
+    with asyncio.Runner() as runner:
+        yield runner.run
+
+
+@pytest.fixture(scope="session")
+def game_config():
+    return load_config()
+
+
+@pytest.fixture
+def metrics():
+    """A fresh, disabled collector per test; host_setup may switch it on."""
+    collector = GameMetrics()
+    collector.set_enabled(False)
+    return collector
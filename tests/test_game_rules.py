@@ -53,11 +53,22 @@ def test_assign_roles(players):
 
     assert spy_count == 1
     assert len(assignments["player_private_states"]) == 4
+    host_state = assignments["host_private_state"]
+    assert host_state["spies_set"] == {p for p, r in roles.items() if r == "spy"}
+    assert host_state["civilians_set"] == set(players) - host_state["spies_set"]
     spy_word = assignments["host_private_state"]["spy_word"]
     civilian_word = assignments["host_private_state"]["civilian_word"]
     assert spy_word != civilian_word
 
 
+def test_assign_roles_is_reproducible_with_seed(players):
+    first = assign_roles_and_words(players, host_private_state={"seed": 7})
+    second = assign_roles_and_words(players, host_private_state={"seed": 7})
+
+    assert first["host_private_state"] == second["host_private_state"]
+    assert first["host_private_state"]["seed"] == 7
+
+
 def test_calculate_elimination():
     # Unique elimination
     state = {
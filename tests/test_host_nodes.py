@@ -1,21 +1,7 @@
 import pytest
-from src.game.config import load_config
-from src.game.metrics import GameMetrics
 from src.game.nodes.host import host_setup, host_stage_switch, host_result
 
 
-@pytest.fixture
-def game_config():
-    return load_config()
-
-
-@pytest.fixture
-def metrics():
-    collector = GameMetrics()
-    collector.set_enabled(False)
-    return collector
-
-
 @pytest.fixture
 def base_state():
     """A base game state fixture for tests."""
@@ -63,7 +49,7 @@ def test_host_stage_switch(base_state):
     }
     update_done = host_stage_switch(speaking_state_done)
     assert update_done.get("game_phase") == "voting"
-    assert "phase_id" in update_done
+    assert update_done["phase_id"].startswith("1:voting:")
 
 
 def test_host_result_elimination_and_advance(base_state, metrics):
@@ -92,10 +78,43 @@ def test_host_result_elimination_and_advance(base_state, metrics):
 
     assert update["game_phase"] == "speaking"
     assert update["current_round"] == 2
+    assert update["phase_id"].startswith("2:speaking:")
     assert update["eliminated_players"] == ["a"]  # 'a' gets 3 votes
     assert update["current_votes"] == {}
 
 
+def test_host_result_seeded_tie_break_is_per_round(base_state, metrics):
+    """Tests that a seeded game breaks the same tie the same way each replay."""
+    # 'a' and 'c' tie on two votes; eliminating either civilian keeps the game going.
+    tied_state = base_state | {
+        "game_phase": "voting",
+        "current_votes": {
+            "a": {"target": "c"},
+            "b": {"target": "a"},
+            "d": {"target": "c"},
+            "e": {"target": "a"},
+        },
+        "host_private_state": {
+            "seed": 42,
+            "player_roles": {
+                "a": "civilian",
+                "b": "spy",
+                "c": "civilian",
+                "d": "civilian",
+                "e": "civilian",
+            },
+        },
+    }
+
+    def eliminated_in(round_number):
+        state = tied_state | {"current_round": round_number}
+        return host_result(state, metrics=metrics)["eliminated_players"]
+
+    assert eliminated_in(1) == eliminated_in(1)
+    per_round = [eliminated_in(round_number)[0] for round_number in range(1, 21)]
+    assert set(per_round) == {"a", "c"}
+
+
 def test_host_result_spy_win(base_state, metrics):
     """Tests the condition for a spy victory."""
     voting_state = base_state | {
@@ -0,0 +1,68 @@
+import pytest
+
+from src.tools.llm import (
+    _resolve_provider,
+    create_llm,
+    overrides_from_config,
+    require_llm_provider_api_key,
+    reset_env_cache,
+)
+
+
+def test_create_llm_reuses_client_for_same_config():
+    create_llm.cache_clear()
+    first = create_llm(provider="openai", model="gpt-5-nano", api_key="test-key")
+    second = create_llm(provider="openai", model="gpt-5-nano", api_key="test-key")
+    other = create_llm(provider="openai", model="gpt-5-mini", api_key="test-key")
+
+    assert first is second
+    assert other is not first
+
+
+def test_create_llm_builds_fresh_client_for_unhashable_overrides():
+    create_llm.cache_clear()
+    kwargs = {
+        "provider": "openai",
+        "model": "gpt-5-nano",
+        "api_key": "test-key",
+        "model_kwargs": {"user": "tester"},
+    }
+
+    assert create_llm(**kwargs) is not create_llm(**kwargs)
+
+
+def test_overrides_from_config_returns_plain_dict_without_copy():
+    configurable = {"provider": "openai", "model": "gpt-5-nano"}
+
+    assert overrides_from_config({"configurable": configurable}) is configurable
+    assert overrides_from_config(None) == {}
+    assert overrides_from_config({"configurable": None}) == {}
+
+
+def test_reset_env_cache_picks_up_changed_provider(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    reset_env_cache()
+    assert _resolve_provider(None).name == "openai"
+
+    monkeypatch.setenv("LLM_PROVIDER", "deepseek")
+    assert _resolve_provider(None).name == "openai"
+
+    reset_env_cache()
+    assert _resolve_provider(None).name == "deepseek"
+    monkeypatch.undo()
+    reset_env_cache()
+
+
+def test_require_api_key_remembers_validated_provider(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    reset_env_cache()
+    require_llm_provider_api_key("openai")
+
+    monkeypatch.delenv("OPENAI_API_KEY")
+    require_llm_provider_api_key("openai")
+
+    reset_env_cache()
+    with pytest.raises(RuntimeError):
+        require_llm_provider_api_key("openai")
+    monkeypatch.undo()
+    reset_env_cache()
@@ -1,12 +1,25 @@
-import asyncio
+import json
+import time
 from typing import Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.game.strategy import llm_update_player_mindset
+import pytest
+
+from src.game.strategy import (
+    llm_generate_speech,
+    llm_update_player_mindset,
+)
 from src.game.strategy.builders.prompt_builder import (
-    _INFERENCE_PROMPT_PREFIX,
+    format_inference_system_prompt,
     format_speech_system_prompt as _format_speech_system_prompt,
 )
+from src.game.strategy.utils import logging_utils, response_cache
+from src.game.strategy.utils.response_cache import configure_response_cache
+from src.game.strategy.utils.text_utils import sanitize_speech_output
+from src.game.strategy.utils.logging_utils import (
+    flush_self_belief_log,
+    log_self_belief_update,
+)
 from src.game.strategy.builders.context_builder import (
     build_inference_user_context as _build_inference_user_context,
     build_speech_user_context as _build_speech_user_context,
@@ -77,6 +90,13 @@ mock_state_speech_vote_en = {
     "current_round": 1,
 }
 
+# llm_generate_speech no longer takes suspicions.
+mock_speech_request_en = {
+    key: value
+    for key, value in mock_state_speech_vote_en.items()
+    if key != "suspicions"
+}
+
 mock_state_speech_vote_zh = {
     "my_word": "apple",
     "self_belief": make_self_belief(role="civilian", confidence=0.8),
@@ -121,10 +141,8 @@ def build_inference_prompt_for_test(
     rules: dict,
     existing_player_mindset: PlayerMindset,
 ):
-    static_prompt = _INFERENCE_PROMPT_PREFIX.format(
-        my_word=my_word,
-        player_count=len(players),
-        spy_count=rules.get("spy_count", 1),
+    static_prompt = format_inference_system_prompt(
+        my_word, len(players), rules.get("spy_count", 1)
     )
     dynamic_prompt = _build_inference_user_context(
         completed_speeches, players, alive, me, existing_player_mindset
@@ -134,8 +152,7 @@ def build_inference_prompt_for_test(
 
 def test_build_inference_prompt_en():
     """Tests that the English inference prompt is built correctly."""
-    test_state = mock_state_inference_en.copy()
-    prompt = build_inference_prompt_for_test(**test_state)
+    prompt = build_inference_prompt_for_test(**mock_state_inference_en)
     assert "Who is the Spy" in prompt
     assert "<inference_context>" in prompt
     assert '<players me="a">' in prompt
@@ -145,8 +162,7 @@ def test_build_inference_prompt_en():
 
 def test_build_inference_prompt_zh():
     """Tests that the Chinese inference prompt is built correctly."""
-    test_state = mock_state_inference_zh.copy()
-    prompt = build_inference_prompt_for_test(**test_state)
+    prompt = build_inference_prompt_for_test(**mock_state_inference_zh)
     # assert "谁是卧底" in prompt  # TODO: Add translation check
     assert "Who is the Spy" in prompt
     assert '<mindset self_role="civilian" self_confidence="0.80">' in prompt
@@ -172,10 +188,9 @@ def build_speech_prompt_for_test(
 
 def test_build_speech_prompt_en():
     """Tests that the English speech prompt is built correctly."""
-    test_state = mock_state_speech_vote_en.copy()
     prompt = build_speech_prompt_for_test(
         speech_plan=mock_speech_plan,
-        **test_state,
+        **mock_state_speech_vote_en,
     )
     assert 'Your secret word is "apple"' in prompt
     assert "<speech_context>" in prompt
@@ -189,10 +204,9 @@ def test_build_speech_prompt_en():
 
 def test_build_speech_prompt_zh():
     """Tests that the Chinese speech prompt is built correctly."""
-    test_state = mock_state_speech_vote_zh.copy()
     prompt = build_speech_prompt_for_test(
         speech_plan=mock_speech_plan,
-        **test_state,
+        **mock_state_speech_vote_zh,
     )
     # assert "轮到你发言了" in prompt  # TODO: Add translation check
     assert 'Your secret word is "apple"' in prompt
@@ -203,7 +217,30 @@ def test_build_speech_prompt_zh():
     assert '<speech seq="0" player="b">It&#x27;s a type of fruit.</speech>' in prompt
 
 
-def test_llm_update_player_mindset_success():
+def test_sanitize_speech_output_keeps_last_line_without_emoji():
+    raw = "Thinking...\r\n\nFinal:  It's warm ☕ and   sweet 😀 \n  \n"
+    assert sanitize_speech_output(raw) == "Final: It's warm and sweet"
+    assert sanitize_speech_output(" \n\t\n") == ""
+    assert sanitize_speech_output(None) == ""
+
+
+def test_speech_logs_refresh_after_append():
+    """Tests that shared speech log rendering picks up newly appended speeches."""
+    speeches = list(mock_state_speech_vote_en["completed_speeches"])
+    self_belief = make_self_belief()
+    first = _build_speech_user_context(self_belief, speeches, "a", ["a", "b"], 1)
+    assert "It&#x27;s a fruit." in first
+
+    speeches.append(
+        {"round": 1, "seq": 1, "player_id": "a", "content": "Crunchy and sweet."}
+    )
+    second = _build_inference_user_context(
+        speeches, ["a", "b"], ["a", "b"], "a", mock_player_mindset
+    )
+    assert '<speech seq="1" player="a">Crunchy and sweet.</speech>' in second
+
+
+def test_llm_update_player_mindset_success(run_async):
     """Tests successful belief inference with structured output."""
     # Mock the agent's invoke method to return structured response
     mock_agent = MagicMock()
@@ -218,10 +255,9 @@ def test_llm_update_player_mindset_success():
 
     # Mock create_agent to return our mock agent
     with patch("src.game.strategy.strategy_core.create_agent", return_value=mock_agent):
-        mock_llm = MagicMock()
-        test_state = mock_state_inference_en.copy()
-        result = asyncio.run(
-            llm_update_player_mindset(llm_client=mock_llm, **test_state)
+        mock_llm = object()
+        result = run_async(
+            llm_update_player_mindset(llm_client=mock_llm, **mock_state_inference_en)
         )
 
         assert result["self_belief"]["role"] == "civilian"
@@ -229,7 +265,7 @@ def test_llm_update_player_mindset_success():
         mock_agent.ainvoke.assert_awaited_once()
 
 
-def test_llm_update_player_mindset_failure():
+def test_llm_update_player_mindset_failure(run_async):
     """Tests fallback behavior when structured output extraction fails for inference."""
     # Mock the agent's invoke method to return None (simulating failure)
     mock_agent = MagicMock()
@@ -237,10 +273,9 @@ def test_llm_update_player_mindset_failure():
 
     # Mock create_agent to return our mock agent
     with patch("src.game.strategy.strategy_core.create_agent", return_value=mock_agent):
-        mock_llm = MagicMock()
-        test_state = mock_state_inference_en.copy()
-        result = asyncio.run(
-            llm_update_player_mindset(llm_client=mock_llm, **test_state)
+        mock_llm = object()
+        result = run_async(
+            llm_update_player_mindset(llm_client=mock_llm, **mock_state_inference_en)
         )
 
         assert result["self_belief"]["role"] == "civilian"
@@ -249,3 +284,125 @@ def test_llm_update_player_mindset_failure():
             == mock_player_mindset["self_belief"]["confidence"]
         )
         mock_agent.ainvoke.assert_awaited_once()
+
+
+def test_llm_update_player_mindset_reuses_agent_per_client(run_async):
+    """Tests that the mindset agent is built once per LLM client."""
+    mock_agent = MagicMock()
+    mock_agent.ainvoke = AsyncMock(return_value={"structured_response": None})
+
+    with patch(
+        "src.game.strategy.strategy_core.create_agent", return_value=mock_agent
+    ) as mock_create_agent:
+        mock_llm = MagicMock()
+        for _ in range(2):
+            run_async(
+                llm_update_player_mindset(
+                    llm_client=mock_llm, **mock_state_inference_en
+                )
+            )
+
+        mock_create_agent.assert_called_once()
+        assert mock_agent.ainvoke.await_count == 2
+
+
+def test_llm_generate_speech_marks_system_prompt_cacheable_for_claude(run_async):
+    """Tests that Anthropic-backed clients get a cache_control system block."""
+    mock_llm = MagicMock()
+    mock_llm.model_name = "anthropic/claude-haiku-4.5"
+    mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content="Round and red."))
+
+    speech = run_async(
+        llm_generate_speech(llm_client=mock_llm, **mock_speech_request_en)
+    )
+
+    assert speech == "Round and red."
+    system_message = mock_llm.ainvoke.await_args.args[0][0]
+    assert system_message.content[0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_llm_generate_speech_reuses_cached_response(run_async):
+    """Tests that an enabled response cache skips repeated identical calls."""
+    mock_llm = MagicMock()
+    mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content="Round and red."))
+
+    configure_response_cache(8)
+    try:
+        speeches = [
+            run_async(
+                llm_generate_speech(llm_client=mock_llm, **mock_speech_request_en)
+            )
+            for _ in range(2)
+        ]
+    finally:
+        configure_response_cache(0)
+
+    assert speeches == ["Round and red.", "Round and red."]
+    mock_llm.ainvoke.assert_awaited_once()
+
+
+def test_response_cache_size_is_read_on_first_use(monkeypatch):
+    """Tests that a cache size loaded into the environment after import applies."""
+    monkeypatch.setattr(response_cache, "_max_entries", None)
+    monkeypatch.setenv("LIEGRAPH_RESPONSE_CACHE_SIZE", "4")
+
+    assert response_cache.response_cache_enabled()
+
+
+def test_llm_generate_speech_warns_on_legacy_suspicions(run_async):
+    """Tests that the removed suspicions argument is ignored with a warning."""
+    mock_llm = MagicMock()
+    mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content="Round and red."))
+
+    with pytest.warns(DeprecationWarning, match="suspicions"):
+        speech = run_async(
+            llm_generate_speech(llm_client=mock_llm, **mock_state_speech_vote_en)
+        )
+
+    assert speech == "Round and red."
+
+
+def test_log_self_belief_update_writes_buffered_lines(tmp_path, monkeypatch):
+    """Tests that changed beliefs reach the log file once flushed."""
+    monkeypatch.chdir(tmp_path)
+    flush_self_belief_log()
+
+    log_self_belief_update("a", make_self_belief(), make_self_belief("spy", 0.7))
+    log_self_belief_update("c", make_self_belief(), make_self_belief())
+    log_self_belief_update("b", make_self_belief(), make_self_belief("civilian", 0.9))
+    flush_self_belief_log()
+
+    lines = (tmp_path / "logs" / "self_belief_updates.log").read_text().splitlines()
+    entries = [json.loads(line) for line in lines]
+    assert [entry["player_id"] for entry in entries] == ["a", "b"]
+    assert entries[0]["change"]["role_changed"] is True
+
+
+def test_belief_log_rate_limit_is_read_on_first_use(monkeypatch):
+    """Tests that a sampling rate loaded into the environment after import applies."""
+    monkeypatch.setattr(logging_utils, "_rate_limit", None)
+    monkeypatch.setenv("LIEGRAPH_BELIEF_LOG_RATE_LIMIT", "0.5")
+
+    assert logging_utils._get_rate_limit() == 0.5
+
+
+def test_belief_log_stops_queueing_when_file_cannot_open(tmp_path, monkeypatch):
+    """Tests that an unopenable log file disables logging instead of queueing."""
+    flush_self_belief_log()
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(logging_utils, "_LOG_DIR", str(blocker))
+    monkeypatch.setattr(
+        logging_utils, "_LOG_PATH", str(blocker / "self_belief_updates.log")
+    )
+    monkeypatch.setattr(logging_utils, "_log_disabled", False)
+
+    log_self_belief_update("a", make_self_belief(), make_self_belief("spy", 0.7))
+    deadline = time.monotonic() + 5
+    while not logging_utils._log_disabled and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert logging_utils._log_disabled is True
+    assert logging_utils._writer is None
+    log_self_belief_update("b", make_self_belief(), make_self_belief("spy", 0.7))
+    assert logging_utils._pending.empty()
@@ -3,8 +3,6 @@ from typing import Dict
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.game.config import load_config
-from src.game.metrics import GameMetrics
 from src.game.nodes.player import player_speech, player_vote
 from src.game.state import (
     GameState,
@@ -43,18 +41,6 @@ def make_player_private_state(
     }
 
 
-@pytest.fixture
-def game_config():
-    return load_config()
-
-
-@pytest.fixture
-def metrics():
-    collector = GameMetrics()
-    collector.set_enabled(False)
-    return collector
-
-
 @pytest.fixture
 def player_id():
     return "a"
@@ -116,6 +102,24 @@ def base_player_state(player_id):
     }
 
 
+@pytest.fixture(scope="module")
+def minimal_player_state():
+    """Game state without private states, for tests that hit early returns."""
+    return {
+        "players": ["a", "b", "c", "d"],
+        "game_id": "test_game",
+        "current_round": 1,
+        "game_phase": "speaking",
+        "phase_id": "1:speaking:test",
+        "completed_speeches": [],
+        "eliminated_players": [],
+        "current_votes": {},
+        "winner": None,
+        "host_private_state": {"player_roles": {}, "civilian_word": "", "spy_word": ""},
+        "player_private_states": {},
+    }
+
+
 @patch("src.game.nodes.player._get_llm_client")
 @patch("src.game.nodes.player.llm_generate_speech", new_callable=AsyncMock)
 @patch("src.game.nodes.player.llm_update_player_mindset", new_callable=AsyncMock)
@@ -127,10 +131,11 @@ def test_player_speech(
     base_player_state: GameState,
     game_config,
     metrics,
+    run_async,
 ):
     """Tests the player_speech node with mocked LLM calls."""
     # Arrange: Configure mocks to return predictable values
-    mock_llm_client = MagicMock()
+    mock_llm_client = object()
     mock_get_llm.return_value = mock_llm_client
 
     mock_infer.return_value = make_player_mindset(
@@ -140,7 +145,7 @@ def test_player_speech(
     mock_speech.return_value = "This is a test speech."
 
     # Act: Call the player_speech node
-    update = asyncio.run(
+    update = run_async(
         player_speech(
             base_player_state,
             player_id,
@@ -166,6 +171,84 @@ def test_player_speech(
     mock_speech.assert_awaited_once()
 
 
+@patch("src.game.nodes.player._get_llm_client")
+@patch("src.game.nodes.player.llm_generate_speech", new_callable=AsyncMock)
+@patch("src.game.nodes.player.llm_update_player_mindset", new_callable=AsyncMock)
+def test_player_speech_runs_concurrently(
+    mock_infer,
+    mock_speech,
+    mock_get_llm,
+    player_id,
+    base_player_state: GameState,
+    game_config,
+    metrics,
+    run_async,
+):
+    """Tests that gathered player_speech calls overlap instead of serialising.
+
+    Each mocked LLM call waits until every call has entered, so the gather only
+    completes if all 16 speeches are in flight at once.
+    """
+    count = 16
+    mock_get_llm.return_value = object()
+
+    def make_barrier():
+        state = {"entered": 0, "in_flight": 0, "peak": 0}
+        all_entered = asyncio.Event()
+
+        async def wait_for_all():
+            state["entered"] += 1
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            if state["entered"] == count:
+                all_entered.set()
+            await all_entered.wait()
+            state["in_flight"] -= 1
+
+        return state, wait_for_all
+
+    infer_calls, infer_barrier = make_barrier()
+    speech_calls, speech_barrier = make_barrier()
+
+    async def fake_infer(**kwargs):
+        await infer_barrier()
+        return make_player_mindset()
+
+    async def fake_speech(**kwargs):
+        await speech_barrier()
+        return "Concurrent speech."
+
+    mock_infer.side_effect = fake_infer
+    mock_speech.side_effect = fake_speech
+
+    async def speak_all():
+        # A serialised node would wait on the first barrier forever.
+        return await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    player_speech(
+                        dict(base_player_state),
+                        player_id,
+                        game_config=game_config,
+                        metrics=metrics,
+                    )
+                    for _ in range(count)
+                )
+            ),
+            timeout=5,
+        )
+
+    updates = run_async(speak_all())
+
+    assert len(updates) == count
+    assert all(
+        update["completed_speeches"][0]["content"] == "Concurrent speech."
+        for update in updates
+    )
+    assert infer_calls["peak"] == count
+    assert speech_calls["peak"] == count
+
+
 @patch("src.game.nodes.player._get_llm_client")
 @patch("src.game.nodes.player.llm_update_player_mindset", new_callable=AsyncMock)
 @patch("src.game.nodes.player.llm_decide_vote", new_callable=AsyncMock)
@@ -177,10 +260,11 @@ def test_player_vote(
     base_player_state: GameState,
     game_config,
     metrics,
+    run_async,
 ):
     """Tests the player_vote node with mocked LLM calls."""
     # Arrange: Configure mocks
-    mock_llm_client = MagicMock()
+    mock_llm_client = object()
     mock_get_llm.return_value = mock_llm_client
 
     mock_infer.return_value = make_player_mindset(
@@ -196,7 +280,7 @@ def test_player_vote(
     }
 
     # Act: Call the player_vote node
-    update = asyncio.run(
+    update = run_async(
         player_vote(
             voting_state,
             player_id,
@@ -228,38 +312,39 @@ def test_player_vote(
 
 
 def test_player_speech_not_in_speaking_phase(
-    base_player_state: GameState, game_config, metrics
+    minimal_player_state: GameState, game_config, metrics, run_async
 ):
     """Tests that player_speech returns empty dict if not in speaking phase."""
-    state = base_player_state | {"game_phase": "voting"}
-    update = asyncio.run(
+    state = minimal_player_state | {"game_phase": "voting"}
+    update = run_async(
         player_speech(state, "a", game_config=game_config, metrics=metrics)
     )
     assert update == {}
 
 
 def test_player_vote_not_in_voting_phase(
-    base_player_state: GameState,
+    minimal_player_state: GameState,
     game_config,
     metrics,
+    run_async,
 ):
     """Tests that player_vote returns empty dict if not in voting phase."""
-    state = base_player_state | {"game_phase": "speaking"}
-    update = asyncio.run(
+    state = minimal_player_state | {"game_phase": "speaking"}
+    update = run_async(
         player_vote(state, "a", game_config=game_config, metrics=metrics)
     )
     assert update == {}
 
 
 def test_player_node_for_eliminated_player(
-    base_player_state: GameState, game_config, metrics
+    minimal_player_state: GameState, game_config, metrics, run_async
 ):
     """Tests that nodes do nothing for an eliminated player."""
-    state = base_player_state | {"eliminated_players": ["a"]}
-    speech_update = asyncio.run(
+    state = minimal_player_state | {"eliminated_players": ["a"]}
+    speech_update = run_async(
         player_speech(state, "a", game_config=game_config, metrics=metrics)
     )
-    vote_update = asyncio.run(
+    vote_update = run_async(
         player_vote(
             state | {"game_phase": "voting"},
             "a",